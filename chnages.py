@@ -9,6 +9,20 @@ import {
 } from '@/lib/types';
 import { logger } from '@/lib/logger';
 
+interface CachedApplications {
+  applications: JobApplicationListItem[];
+  loadedAt: number;
+}
+
+interface JobStatusRequests {
+  nextSeq: number;
+  // Optimistic values of in-flight requests, keyed by sequence number
+  pending: Record<number, boolean>;
+  // Newest request the server accepted (seq 0 is the value before any request)
+  confirmedSeq: number;
+  confirmedValue: boolean | undefined;
+}
+
 interface CareersState {
   // Job postings
   jobPostings: JobPostingListItem[];
@@ -16,15 +30,22 @@ interface CareersState {
   
   // Applications
   applications: JobApplicationListItem[];
+  applicationsByJob: Record<string, CachedApplications>;
   
   // Public job viewing
   publicJob: PublicJobView | null;
   
+  // Derived counts (kept in sync with jobPostings)
+  activeJobsCount: number;
+  
   // Loading states
   isLoading: boolean;
   isCreatingJob: boolean;
   isSubmittingApplication: boolean;
   isUpdatingStatus: boolean;
+  // In-flight status updates per job id
+  updatingJobIds: Record<string, number>;
+  statusRequests: Record<string, JobStatusRequests>;
   
   // Error handling
   error: string | null;
@@ -57,16 +78,83 @@ interface CareersActions {
 
 type CareersStore = CareersState & CareersActions;
 
+// How long cached applications are served without refetching
+const APPLICATIONS_CACHE_TTL_MS = 30_000;
+
+const countActiveJobs = (jobs: JobPostingListItem[]): number => {
+  let count = 0;
+  for (const job of jobs) {
+    if (job.is_active) count++;
+  }
+  return count;
+};
+
+const withJobStatus = (state: CareersState, jobId: string, isActive: boolean) => {
+  // Adjust the active count by the actual change instead of recounting
+  let delta = 0;
+  const jobPostings = state.jobPostings.map(job => {
+    if (job.job_id !== jobId) return job;
+    if (job.is_active !== isActive) delta = isActive ? 1 : -1;
+    return { ...job, is_active: isActive };
+  });
+  return {
+    jobPostings,
+    activeJobsCount: state.activeJobsCount + delta,
+    selectedJob: state.selectedJob?.job_id === jobId 
+      ? { ...state.selectedJob, is_active: isActive } 
+      : state.selectedJob,
+  };
+};
+
+const withStatusRequests = (
+  state: CareersState, 
+  jobId: string, 
+  requests: JobStatusRequests
+) => {
+  const statusRequests = { ...state.statusRequests };
+  const updatingJobIds = { ...state.updatingJobIds };
+  const pending = Object.keys(requests.pending).length;
+  if (pending > 0) {
+    statusRequests[jobId] = requests;
+    updatingJobIds[jobId] = pending;
+  } else {
+    delete statusRequests[jobId];
+    delete updatingJobIds[jobId];
+  }
+  return {
+    statusRequests,
+    updatingJobIds,
+    isUpdatingStatus: Object.keys(updatingJobIds).length > 0,
+  };
+};
+
+// The status to show: the newest in-flight request, else the newest confirmed one
+const resolveJobStatus = (requests: JobStatusRequests) => {
+  let seq = requests.confirmedSeq;
+  let value = requests.confirmedValue;
+  for (const [key, pendingValue] of Object.entries(requests.pending)) {
+    if (Number(key) > seq) {
+      seq = Number(key);
+      value = pendingValue;
+    }
+  }
+  return value;
+};
+
 export const useCareersStore = create<CareersStore>((set, get) => ({
   // Initial state
   jobPostings: [],
   selectedJob: null,
   applications: [],
+  applicationsByJob: {},
   publicJob: null,
+  activeJobsCount: 0,
   isLoading: false,
   isCreatingJob: false,
   isSubmittingApplication: false,
   isUpdatingStatus: false,
+  updatingJobIds: {},
+  statusRequests: {},
   error: null,
   
   // Actions
@@ -107,7 +195,13 @@ loadJobPostings: async () => {
     const postings = await api.listJobPostings(true);
     
     logger.info(`Loaded ${postings.length} job postings`);
-    set({ jobPostings: postings, isLoading: false });
+    // Application counts may have changed, so drop cached applications
+    set({ 
+      jobPostings: postings, 
+      activeJobsCount: countActiveJobs(postings), 
+      applicationsByJob: {},
+      isLoading: false 
+    });
   } catch (error: any) {
     logger.error('Failed to load job postings:', error);
     set({ 
@@ -119,36 +213,79 @@ loadJobPostings: async () => {
   
   selectJob: (job: JobPostingListItem) => {
     logger.info('Selected job', { jobId: job.job_id, title: job.job_title });
-    set({ selectedJob: job });
-    // Auto-load applications when job is selected
+    const cached = get().applicationsByJob[job.job_id];
+    if (cached) {
+      // Show applications already fetched for this job right away. Another
+      // job's fetch may still be pending, so its loading flag doesn't apply.
+      set({ 
+        selectedJob: job, 
+        applications: cached.applications, 
+        isLoading: false, 
+        error: null 
+      });
+      if (Date.now() - cached.loadedAt < APPLICATIONS_CACHE_TTL_MS) return;
+    } else {
+      set({ selectedJob: job, applications: [] });
+    }
+    // Auto-load applications when job is selected or the cached list is stale
     get().loadJobApplications(job.job_id);
   },
   
   updateJobStatus: async (jobId: string, isActive: boolean) => {
-    set({ isUpdatingStatus: true, error: null });
+    // selectedJob is updated too and may no longer be in jobPostings
+    const { jobPostings, selectedJob, statusRequests } = get();
+    const previous = jobPostings.find(job => job.job_id === jobId)
+      ?? (selectedJob?.job_id === jobId ? selectedJob : undefined);
+    const requests = statusRequests[jobId] ?? {
+      nextSeq: 1,
+      pending: {},
+      confirmedSeq: 0,
+      confirmedValue: previous?.is_active,
+    };
+    const seq = requests.nextSeq;
+    
+    // Update the job in the local state before the request resolves
+    set((state) => ({
+      ...withJobStatus(state, jobId, isActive),
+      ...withStatusRequests(state, jobId, {
+        ...requests,
+        nextSeq: seq + 1,
+        pending: { ...requests.pending, [seq]: isActive },
+      }),
+      error: null
+    }));
+    
+    // Drop this request and re-apply the status it leaves in charge. This
+    // also restores the value if loadJobPostings replaced the list meanwhile.
+    const settle = (state: CareersState, succeeded: boolean) => {
+      const current = state.statusRequests[jobId];
+      if (!current) return {};
+      const pending = { ...current.pending };
+      delete pending[seq];
+      const next = succeeded && seq > current.confirmedSeq
+        ? { ...current, pending, confirmedSeq: seq, confirmedValue: isActive }
+        : { ...current, pending };
+      const value = resolveJobStatus(next);
+      return {
+        ...(value === undefined ? {} : withJobStatus(state, jobId, value)),
+        ...withStatusRequests(state, jobId, next),
+      };
+    };
+    
     try {
       logger.info('Updating job status', { jobId, isActive });
       await api.updateJobStatus(jobId, { is_active: isActive });
       
-      // Update the job in the local state
-      set((state) => ({
-        jobPostings: state.jobPostings.map(job => 
-          job.job_id === jobId ? { ...job, is_active: isActive } : job
-        ),
-        selectedJob: state.selectedJob?.job_id === jobId 
-          ? { ...state.selectedJob, is_active: isActive } 
-          : state.selectedJob,
-        isUpdatingStatus: false
-      }));
+      set((state) => settle(state, true));
       
       logger.info('Job status updated successfully', { jobId, isActive });
       return true;
     } catch (error: any) {
       logger.error('Failed to update job status:', error);
-      set({ 
-        isUpdatingStatus: false, 
+      set((state) => ({
+        ...settle(state, false),
         error: error.message || 'Failed to update job status' 
-      });
+      }));
       return false;
     }
   },
@@ -160,13 +297,20 @@ loadJobPostings: async () => {
       const applications = await api.getJobApplications(jobId);
       
       logger.info(`Loaded ${applications.length} applications for job ${jobId}`);
-      set({ applications, isLoading: false });
+      // Only show the result if the user hasn't moved on to another job
+      set((state) => ({
+        applicationsByJob: { 
+          ...state.applicationsByJob, 
+          [jobId]: { applications, loadedAt: Date.now() } 
+        },
+        ...(state.selectedJob?.job_id === jobId ? { applications, isLoading: false } : {})
+      }));
     } catch (error: any) {
       logger.error('Failed to load applications:', error);
-      set({ 
-        isLoading: false, 
-        error: error.message || 'Failed to load applications' 
-      });
+      set((state) => state.selectedJob?.job_id === jobId 
+        ? { isLoading: false, error: error.message || 'Failed to load applications' } 
+        : {}
+      );
     }
   },
   
@@ -229,12 +373,23 @@ loadPublicJob: async (token: string) => {
       jobPostings: [],
       selectedJob: null,
       applications: [],
+      applicationsByJob: {},
       publicJob: null,
+      activeJobsCount: 0,
       isLoading: false,
       isCreatingJob: false,
       isSubmittingApplication: false,
       isUpdatingStatus: false,
+      updatingJobIds: {},
+      statusRequests: {},
       error: null,
     });
   },
 }));
+
+// Job counts for the stats cards; use with useShallow so unchanged counts don't re-render
+export const selectJobCounts = (state: CareersStore) => ({
+  active: state.activeJobsCount,
+  inactive: state.jobPostings.length - state.activeJobsCount,
+  total: state.jobPostings.length,
+});